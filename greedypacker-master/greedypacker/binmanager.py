@@ -36,6 +36,10 @@ class BinManager:
         self.bin_width = bin_width
         self.bin_height = bin_height
         self.items = [] # type: List[item.Item]
+        # Parallel width/height columns so sorting reads flat
+        # lists instead of item attributes
+        self._widths = [] # type: List[int]
+        self._heights = [] # type: List[int]
         self.bin_count = 0
         self.bin_algo = bin_algo
         self.pack_algo = pack_algo
@@ -55,66 +59,54 @@ class BinManager:
         self.rectangle_merge = rectangle_merge
         self.wastemap = wastemap
 
-        defaultBin = self._bin_factory() 
+        defaultBin = self._bin_factory()
         self.bins = [defaultBin]
-
-    def items_sort(self): 
-        # By Area Ascending
-        if self.sorting_heuristic == 'ASCA':
-            key = lambda el: el.width*el.height
-            self.items.sort(key=key, reverse=False)
-        # By Area Descending
-        elif self.sorting_heuristic == 'DESCA':
-            key = lambda el: el.width*el.height
-            self.items.sort(key=key, reverse=True)
-        # By Shorter Side Ascending
-        elif self.sorting_heuristic == 'ASCSS':
-            key = lambda el: el.width if el.width < el.height else el.height
-            self.items.sort(key=key, reverse=False)
-        # By Shorter Side Descending
-        elif self.sorting_heuristic == 'DESCSS':
-            key = lambda el: el.width if el.width < el.height else el.height
-            self.items.sort(key=key, reverse=True)
-        # By Longer Side Ascending
-        elif self.sorting_heuristic == 'ASCLS':
-            key = lambda el: el.width if el.width > el.height else el.height
-            self.items.sort(key=key, reverse=False)
-        # By Longer Side Descending
-        elif self.sorting_heuristic == 'DESCLS':
-            key = lambda el: el.width if el.width > el.height else el.height
-            self.items.sort(key=key, reverse=True)
-        # By Perimiter Ascending
-        elif self.sorting_heuristic == 'ASCPERIM':
-            key = lambda el: (2*el.width)+(2*el.height)
-            self.items.sort(key=key, reverse=False)
-        # By Perimiter Descending
-        elif self.sorting_heuristic == 'DESCPERIM':
-            key = lambda el: (2*el.width)+(2*el.height)
-            self.items.sort(key=key, reverse=True)
-        # By Difference in Side Length Ascending
-        elif self.sorting_heuristic == 'ASCDIFF':
-            key = lambda el: abs(el.width-el.height)
-            self.items.sort(key=key, reverse=False)
-        # By Difference in Side Length Descending
-        elif self.sorting_heuristic == 'DESCDIFF':
-            key = lambda el: abs(el.width-el.height)
-            self.items.sort(key=key, reverse=True)
-        # By Side Ratio Ascending
-        elif self.sorting_heuristic == 'ASCRATIO':
-            key = lambda el: el.width/el.height
-            self.items.sort(key=key, reverse=False)
-        # By Side Ratio Descending
-        elif self.sorting_heuristic == 'DESCRATIO':
-            key = lambda el: el.width/el.height
-            self.items.sort(key=key, reverse=True)
+        # Per-bin memo of _find_best_score results keyed by item
+        # dimensions. Entries are dropped when a bin accepts an item.
+        self._score_cache = {} # type: dict
+
+    # Sorting heuristic -> (key function, descending) pairs
+    _SORT_KEYS = {
+        # By Area
+        'ASCA': (lambda w, h: w*h, False),
+        'DESCA': (lambda w, h: w*h, True),
+        # By Shorter Side
+        'ASCSS': (lambda w, h: w if w < h else h, False),
+        'DESCSS': (lambda w, h: w if w < h else h, True),
+        # By Longer Side
+        'ASCLS': (lambda w, h: w if w > h else h, False),
+        'DESCLS': (lambda w, h: w if w > h else h, True),
+        # By Perimiter
+        'ASCPERIM': (lambda w, h: (2*w)+(2*h), False),
+        'DESCPERIM': (lambda w, h: (2*w)+(2*h), True),
+        # By Difference in Side Length
+        'ASCDIFF': (lambda w, h: abs(w-h), False),
+        'DESCDIFF': (lambda w, h: abs(w-h), True),
+        # By Side Ratio
+        'ASCRATIO': (lambda w, h: w/h, False),
+        'DESCRATIO': (lambda w, h: w/h, True),
+    }
+
+
+    def items_sort(self):
         # Default to DESCA
-        else:
-            key = lambda el: el.width*el.height
-            self.items.sort(key=key, reverse=True)
+        key, reverse = self._SORT_KEYS.get(self.sorting_heuristic,
+                                           self._SORT_KEYS['DESCA'])
+
+        # Decorate-sort-undecorate over the key column: compute
+        # each key once, sort the indices, reorder the columns
+        keys = [(key(w, h), i)
+                for i, (w, h) in enumerate(zip(self._widths, self._heights))]
+        keys.sort(key=lambda pair: pair[0], reverse=reverse)
+        order = [i for _, i in keys]
+        self.items = [self.items[i] for i in order]
+        self._widths = [self._widths[i] for i in order]
+        self._heights = [self._heights[i] for i in order]
 
     def add_items(self, *items: item.Item) -> None:
-        for item in items:
-            self.items.append(item)
+        self.items.extend(items)
+        self._widths.extend(el.width for el in items)
+        self._heights.extend(el.height for el in items)
         if self.sorting:
             self.items_sort()
 
@@ -138,23 +130,23 @@ class BinManager:
         raise ValueError('Error: No such Algorithm')
 
 
-    def _bin_first_fit(self, item: item.Item) -> None:
+    def _bin_first_fit(self, item: item.Item) -> Any:
         """
-        Insert into the first bin that fits the item
+        Insert into the first bin that fits the item.
+        Returns the bin the item was placed in.
         """
-        result = False
         for binn in self.bins:
-            result = binn.insert(item, self.heuristic)
-            if result:
-                break
-        if not result:
-            self.bins.append(self._bin_factory())
-            self.bins[-1].insert(item, self.heuristic)
+            if binn.insert(item, self.heuristic):
+                return binn
+        self.bins.append(self._bin_factory())
+        self.bins[-1].insert(item, self.heuristic)
+        return self.bins[-1]
 
 
-    def _bin_best_fit(self, item: item.Item) -> bool:
+    def _bin_best_fit(self, item: item.Item) -> Any:
         """
-        Insert into the bin that best fits the item
+        Insert into the bin that best fits the item.
+        Returns the bin the item was placed in.
         """
 
         # Ensure item can theoretically fit the bin
@@ -170,23 +162,63 @@ class BinManager:
             raise ValueError("Error! item too big for bin")
 
         scores = []
+        key = (item.width, item.height)
+        best = None
         for binn in self.bins:
-            s, _, _ = binn._find_best_score(item)[:3]
+            # A saturated bin can never fit the item
+            if binn.free_area < item.area:
+                continue
+            bin_scores = self._score_cache.setdefault(id(binn), {})
+            try:
+                s = bin_scores[key]
+            except KeyError:
+                if best is not None and isinstance(binn, skyline.Skyline):
+                    # Bounded query: None only means "can't beat the
+                    # running best", so the result is not cached
+                    s = binn._find_best_score(item, upper_bound=best)[0]
+                else:
+                    s = binn._find_best_score(item)[0]
+                    bin_scores[key] = s
             if s is not None:
                 scores.append((s, binn))
+                if best is None or s < best:
+                    best = s
         if scores:
             _, best_bin = min(scores, key=lambda x: x[0])
-            return best_bin.insert(item)
+            self._score_cache.pop(id(best_bin), None)
+            best_bin.insert(item)
+            return best_bin
 
         new_bin = self._bin_factory()
         new_bin.insert(item, self.heuristic)
         self.bins.append(new_bin)
-        return True
+        return new_bin
 
 
     def execute(self) -> None:
         """
-        Loop over all items and attempt insertion
+        Loop over all items and attempt insertion. Consecutive
+        identically sized items are placed as a run: the first is
+        scored normally and the rest ride its placement without
+        re-scoring where the bin supports it.
         """
-        for item in self.items:
-            self.bin_sel_algo(item)
+        i = 0
+        n = len(self.items)
+        while i < n:
+            first = self.items[i]
+            j = i + 1
+            while (j < n and
+                   self.items[j].width == first.width and
+                   self.items[j].height == first.height):
+                j += 1
+            binn = self.bin_sel_algo(first)
+            k = i + 1
+            if k < j and isinstance(binn, skyline.Skyline):
+                placed = binn.insert_run(first, self.items[k:j])
+                if placed:
+                    self._score_cache.pop(id(binn), None)
+                    k += placed
+            while k < j:
+                self.bin_sel_algo(self.items[k])
+                k += 1
+            i = j
@@ -11,7 +11,6 @@ import bisect
 from typing import List, Tuple
 from functools import reduce
 from collections import namedtuple
-from sortedcontainers import SortedListWithKey # type: ignore
 from item import Item
 
 
@@ -22,6 +21,9 @@ class FreeRectangle(typing.NamedTuple('FreeRectangle', [('width', int), ('height
         return self.width*self.height
 
 
+_by_area = operator.attrgetter('area')
+
+
 class Guillotine:
     def __init__(self, x: int = 8,
                  y: int = 4,
@@ -52,10 +54,9 @@ class Guillotine:
             raise ValueError('No such heuristic!')
 
         if x == 0 or y == 0:
-            #self.freerects = [] # type: List[FreeRectangle]
-            self.freerects = SortedListWithKey(iterable=None, key=lambda x: x.area)
+            self.freerects = [] # type: List[FreeRectangle]
         else:
-            self.freerects = SortedListWithKey([FreeRectangle(self.x, self.y, 0, 0)], key=lambda x: x.area)
+            self.freerects = [FreeRectangle(self.x, self.y, 0, 0)]
         self.items = [] # type: List[Item]
         self.rotation = rotation
 
@@ -64,6 +65,13 @@ class Guillotine:
         return "Guillotine(%r)" % (self.items)
 
 
+    def _add_freerect(self, rect: FreeRectangle) -> None:
+        """
+        Insert rect keeping freerects sorted by area
+        """
+        bisect.insort(self.freerects, rect, key=_by_area)
+
+
     @staticmethod
     def _item_fits_rect(item: Item,
                        rect: FreeRectangle,
@@ -166,7 +174,7 @@ class Guillotine:
                                                 freerect.y)
                     self.freerects.remove(freerect)
                     self.freerects.remove(match_rect)
-                    self.freerects.add(merged_rect)
+                    self._add_freerect(merged_rect)
 
             if matching_heights:
                 heights_adjacent = list(filter(lambda r: r.x == freerect.x + freerect.width, matching_heights))
@@ -178,7 +186,7 @@ class Guillotine:
                                                 freerect.y)
                     self.freerects.remove(freerect)
                     self.freerects.remove(match_rect)
-                    self.freerects.add(merged_rect)
+                    self._add_freerect(merged_rect)
 
 
     def _find_best_score(self, item: Item):
@@ -205,7 +213,7 @@ class Guillotine:
             self.freerects.remove(best_rect)
             splits = self._split_free_rect(item, best_rect)
             for rect in splits:
-                self.freerects.add(rect)
+                self._add_freerect(rect)
             if self.rMerge:
                 self.rectangle_merge()
             return True
@@ -154,7 +154,7 @@ class Sheet:
                                                     freeHeight,
                                                     freeX,
                                                     freeY)
-                self.wastemap.freerects.add(freeRect)
+                self.wastemap._add_freerect(freeRect)
         # Move remaining shelf width to wastemap
         if shelf.available_width > 0:
             freeWidth = shelf.available_width
@@ -165,7 +165,7 @@ class Sheet:
                                                 freeHeight,
                                                 freeX,
                                                 freeY)
-            self.wastemap.freerects.add(freeRect)
+            self.wastemap._add_freerect(freeRect)
         # Close Shelf
         shelf.available_width = 0
         # Merge rectangles in wastemap
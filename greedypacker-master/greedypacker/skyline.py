@@ -5,16 +5,122 @@ Skyline 2D Bin Algorithm
 Solomon Bothwell
 ssbothwell@gmail.com
 """
-from typing import List, NamedTuple, Tuple
-from sortedcontainers import SortedList
+import bisect
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import List, Tuple
 
 import guillotine
 from item import Item
 
 
-SkylineSegment = NamedTuple('SkylineSegment', [('x', int),
-                                               ('y', int),
-                                               ('width', int)])
+@dataclass(slots=True, frozen=True, order=True)
+class SkylineSegment:
+    x: int
+    y: int
+    width: int
+
+
+def _flatten_skyline(segs: List[SkylineSegment]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Split the skyline into parallel x, y, and width
+    lists for the integer-only fit/waste kernels
+    """
+    seg_x = [seg.x for seg in segs]
+    seg_y = [seg.y for seg in segs]
+    seg_w = [seg.width for seg in segs]
+    return seg_x, seg_y, seg_w
+
+
+def _build_range_max(seg_y: List[int]) -> List[List[int]]:
+    """
+    Sparse table over seg_y: row k holds the max of every
+    2**k wide window, so any range max costs O(1) via
+    _range_max. Built once per skyline query.
+    """
+    n = len(seg_y)
+    table = [seg_y]
+    k = 1
+    while (1 << k) <= n:
+        prev = table[-1]
+        half = 1 << (k - 1)
+        table.append([max(prev[i], prev[i+half])
+                      for i in range(n - (1 << k) + 1)])
+        k += 1
+    return table
+
+
+def _range_max(table: List[List[int]], i: int, j: int) -> int:
+    """
+    max(seg_y[i:j+1]) from two overlapping power-of-two
+    windows of the sparse table
+    """
+    k = (j - i + 1).bit_length() - 1
+    row = table[k]
+    a = row[i]
+    b = row[j - (1 << k) + 1]
+    return a if a > b else b
+
+
+def _check_fit_flat(seg_x: List[int],
+                    y_table: List[List[int]],
+                    cum_w: List[int],
+                    cum_wy: List[int],
+                    n: int,
+                    item_w: int,
+                    item_h: int,
+                    bin_w: int,
+                    bin_h: int,
+                    i: int) -> Tuple[bool, int, int]:
+    """
+    Integer kernel behind Skyline._check_fit. cum_w holds the
+    running sum of segment widths, so the last segment under an
+    item_w wide item placed on segment i is found by bisection,
+    and the support height is an O(1) range max over y_table.
+    cum_wy holds the running sum of width*y, from which the
+    wasted area below the item falls out without another walk.
+    Returns (fits, y, wasted_area).
+    """
+    if seg_x[i] + item_w > bin_w:
+        return (False, None, 0)
+    prev_w = cum_w[i-1] if i else 0
+    j = bisect.bisect_left(cum_w, prev_w + item_w, i)
+    if j == n:
+        return (False, None, 0)
+    y = _range_max(y_table, i, j)
+    if y + item_h > bin_h:
+        return (False, None, 0)
+    # Area under the item: whole segments i..j minus the part of
+    # segment j hanging out past the item's right edge
+    prev_wy = cum_wy[i-1] if i else 0
+    excess_w = (cum_w[j] - prev_w) - item_w
+    below = (cum_wy[j] - prev_wy) - excess_w * y_table[0][j]
+    return (True, y, y * item_w - below)
+
+
+def _calc_waste_flat(seg_x: List[int],
+                     seg_y: List[int],
+                     seg_w: List[int],
+                     n: int,
+                     item_w: int,
+                     y: int,
+                     i: int) -> int:
+    """
+    Integer kernel behind calc_waste. Sums the wasted
+    area below an item_w wide item placed at height y
+    above segment i.
+    """
+    wasted_area = 0
+    item_left = seg_x[i]
+    item_right = item_left + item_w
+    while i < n:
+        seg_end = seg_x[i] + seg_w[i]
+        if seg_x[i] >= item_right or seg_end <= item_left:
+            break
+        right_side = item_right if item_right < seg_end else seg_end
+        wasted_area += (right_side - seg_x[i]) * (y - seg_y[i])
+        i += 1
+    return wasted_area
 
 
 class Skyline:
@@ -26,10 +132,12 @@ class Skyline:
         self.width = width
         self.height = height
         starting_segment = SkylineSegment(0, 0, width)
-        self.skyline = SortedList([starting_segment])
+        self.skyline = [starting_segment] # type: List[SkylineSegment]
         self.items = [] # type: List[Item]
         self.area = self.width * self.height
         self.free_area = self.width * self.height
+        self._efficiency = 0.0
+        self._efficiency_dirty = False
         self.rotation = rotation
         self.use_waste_map = wastemap
         if self.use_waste_map:
@@ -51,61 +159,78 @@ class Skyline:
     @staticmethod
     def _clip_segment(segment: SkylineSegment, item: Item) -> List[SkylineSegment]:
         """
-        Clip out the length of segment adjacent to the item. 
+        Clip out the length of segment adjacent to the item.
         Return the rest.
         """
-        # Segment not under new item
         itemx = item.x
         item_end_x = itemx + item.width
         segx = segment.x
         seg_end_x = segx + segment.width
-        if segx > item_end_x or segx+segment.width<itemx:
-            return [segment]
-        # Segment fully under new item
-        elif segx >= itemx and seg_end_x <= item_end_x:
-            return []
-        # Segment partialy under new item (to the left)
-        elif segx < itemx and seg_end_x <= item_end_x:
-            new_segment = SkylineSegment(segx, segment.y, itemx-segx)        
-            return [new_segment]
-        # Segment partially under new item (to the right)
-        elif segx >= itemx and segx+segment.width > item_end_x:
-            new_segment = SkylineSegment(item_end_x,
-                                         segment.y,
-                                         (seg_end_x)-item_end_x)
-            return [new_segment]
-        # Segment wider then item in both directions
-        elif segx < itemx and segx+segment.width > item_end_x:
-            new_segment_left = SkylineSegment(segx,
-                                              segment.y,
-                                              itemx-segx)
-            new_segment_right = SkylineSegment(item_end_x,
-                                               segment.y,
-                                               (seg_end_x)-item_end_x)
-            return [new_segment_left, new_segment_right]
-        else:
-            return []
+        # Remnant hanging out to the left of the item
+        left_w = min(seg_end_x, itemx) - segx
+        # Remnant hanging out to the right of the item
+        right_start = max(segx, item_end_x)
+        segments = []
+        if left_w > 0:
+            segments.append(SkylineSegment(segx, segment.y, left_w))
+        if seg_end_x > right_start:
+            segments.append(SkylineSegment(right_start, segment.y,
+                                           seg_end_x-right_start))
+        return segments
 
 
-    def _update_segment(self, segment: SkylineSegment, y:int, item: Item) -> List[SkylineSegment]:
+    @staticmethod
+    def _emit_segment(segments: List[SkylineSegment],
+                      x: int, y: int, width: int) -> None:
+        """
+        Append a segment, widening the tail in place instead when
+        it is adjacent and at the same height
+        """
+        if segments:
+            last = segments[-1]
+            if last.y == y and last.x + last.width == x:
+                segments[-1] = SkylineSegment(last.x, y, last.width+width)
+                return
+        segments.append(SkylineSegment(x, y, width))
+
+
+    def _update_segment(self, seg_index: int, y:int, item: Item) -> List[SkylineSegment]:
         """
-        Clips the line segment under the new item and returns
-        an updated skyline segment list.
+        Clips the line segments under the new item and merges
+        adjacent same-height segments in the same left-to-right
+        sweep. Returns the updated skyline segment list.
         """
         if self.use_waste_map:
-            seg_i = self.skyline.index(segment)
-            self._add_to_wastemap(seg_i, item, y)
+            self._add_to_wastemap(seg_index, item, y)
 
-        new_segments = SortedList([])
+        itemx = item.x
+        item_end_x = itemx + item.width
+        # Roof segment above the item, if there is room
+        roof = None
+        if item.height + item.y < self.height:
+            roof = SkylineSegment(itemx, item.y + item.height, item.width)
+
+        new_segments = [] # type: List[SkylineSegment]
         for seg in self.skyline:
-            new_segments.update(self._clip_segment(seg, item))
+            segx = seg.x
+            seg_end_x = segx + seg.width
+            # Remnant hanging out to the left of the item
+            left_w = min(seg_end_x, itemx) - segx
+            if left_w > 0:
+                self._emit_segment(new_segments, segx, seg.y, left_w)
+            # Remnant hanging out to the right of the item; the roof
+            # slots in just before the first one
+            right_start = max(segx, item_end_x)
+            if seg_end_x > right_start:
+                if roof is not None:
+                    self._emit_segment(new_segments, roof.x, roof.y,
+                                       roof.width)
+                    roof = None
+                self._emit_segment(new_segments, right_start, seg.y,
+                                   seg_end_x-right_start)
+        if roof is not None:
+            self._emit_segment(new_segments, roof.x, roof.y, roof.width)
 
-        # Create new segment if room above item
-        if item.height + item.y < self.height:
-            new_seg_y = item.y + item.height
-            new_seg = SkylineSegment(segment.x, new_seg_y, item.width)
-            new_segments.add(new_seg)
-       
         return new_segments
 
 
@@ -113,16 +238,14 @@ class Skyline:
         """
         Merge any adjacent SkylineSegments
         """
-        new_segments = SortedList([self.skyline[0]])
+        new_segments = [self.skyline[0]]
         for seg in self.skyline[1:]:
             last = new_segments[-1]
             if seg.y == last.y and seg.x == last.x+last.width:
-                new_last = SkylineSegment(last.x, last.y, 
-                                          (seg.x+seg.width)-last.x)
-                new_segments.remove(last)
-                new_segments.add(new_last)
+                new_segments[-1] = SkylineSegment(last.x, last.y,
+                                                  (seg.x+seg.width)-last.x)
                 continue
-            new_segments.add(seg)
+            new_segments.append(seg)
 
         self.skyline = new_segments
 
@@ -135,25 +258,15 @@ class Skyline:
         segment sky_index. Also works if the item is wider 
         then the segment.
         """
-        i = sky_index
-        x = self.skyline[i].x
-        y = self.skyline[i].y
-        width = item_width
-
-        if x + item_width > self.width:
-            return (False, None)
-        if y + item_height > self.height:
-            return (False, None)
-
-        while width > 0:
-            y = max(y, self.skyline[i].y)
-            if (y + item_height > self.height):
-                return (False, None)
-            width -= self.skyline[i].width
-            i += 1
-            if width > 0 and i == len(self.skyline):
-                return (False, None)
-        return (True, y)
+        seg_x, seg_y, seg_w = _flatten_skyline(self.skyline)
+        cum_w = list(accumulate(seg_w))
+        cum_wy = list(accumulate(w*y for w, y in zip(seg_w, seg_y)))
+        y_table = _build_range_max(seg_y)
+        fits, y, _waste = _check_fit_flat(seg_x, y_table, cum_w, cum_wy,
+                                          len(seg_x),
+                                          item_width, item_height,
+                                          self.width, self.height, sky_index)
+        return (fits, y)
 
 
     def _add_to_wastemap(self, seg_index: int,
@@ -167,6 +280,7 @@ class Skyline:
         # New node edges
         item_left = self.skyline[seg_index].x
         item_right = item_left + item.width
+        waste_rects = []
         for seg in self.skyline[seg_index:]:
             if seg.x >= item_right or seg.x + seg.width <= item_left:
                 break
@@ -178,29 +292,64 @@ class Skyline:
             w_x = left_side
             w_y = seg.y
             if w_width > 0 and w_height > 0:
-                waste_rect = guillotine.FreeRectangle(w_width,
-                                                      w_height,
-                                                      w_x,
-                                                      w_y)
-                self.wastemap.freerects.add(waste_rect)
-                self.wastemap.rectangle_merge()
+                waste_rects.append(guillotine.FreeRectangle(w_width,
+                                                            w_height,
+                                                            w_x,
+                                                            w_y))
+        if waste_rects:
+            for rect in waste_rects:
+                self.wastemap._add_freerect(rect)
+            self.wastemap.rectangle_merge()
             
 
-    def _find_best_score(self, item: Item) -> Tuple[int, SkylineSegment, int, bool]:
+    def _find_best_score(self, item: Item,
+                         upper_bound: Tuple = None) -> Tuple[int, int, int, bool]:
+        """
+        Score item against every skyline segment. If upper_bound
+        is given, candidates that provably cannot beat it are
+        pruned and only strictly better scores are returned.
+        """
         segs = []
-        for i, segment in enumerate(self.skyline):
-            fits, y = self._check_fit(item.width, item.height, i)
-            if fits: 
-                score = self._score(self.skyline, item, y, i)
-                segs.append((score, segment, y, False))
-            if self.rotation:
-                fits, y = self._check_fit(item.height, item.width, i)
+        seg_x, seg_y, seg_w = _flatten_skyline(self.skyline)
+        cum_w = list(accumulate(seg_w))
+        cum_wy = list(accumulate(w*y for w, y in zip(seg_w, seg_y)))
+        y_table = _build_range_max(seg_y)
+        n = len(seg_x)
+        # For bottom_left, seg_y[i] + item height is a lower bound
+        # on the score, so segments above it can be skipped outright
+        bl_bound = None
+        if upper_bound is not None and self._score is scoreBL:
+            bl_bound = upper_bound[0]
+        # Rotation is redundant for squares and infeasible when the
+        # rotated item cannot fit the bin at all
+        try_rot = (self.rotation and
+                   item.width != item.height and
+                   item.height <= self.width and
+                   item.width <= self.height)
+        for i in range(n):
+            if bl_bound is None or seg_y[i] + item.height <= bl_bound:
+                fits, y, waste = _check_fit_flat(seg_x, y_table, cum_w,
+                                                 cum_wy, n,
+                                                 item.width, item.height,
+                                                 self.width, self.height, i)
                 if fits:
-                    score = self._score(self.skyline, item, y, i, rotation=True)
-                    segs.append((score, segment, y, True))
+                    score = self._score(item, y, seg_w[i], waste)
+                    if upper_bound is None or score < upper_bound:
+                        segs.append((score, i, y, False))
+            if try_rot:
+                if bl_bound is None or seg_y[i] + item.width <= bl_bound:
+                    fits, y, waste = _check_fit_flat(seg_x, y_table, cum_w,
+                                                     cum_wy, n,
+                                                     item.height, item.width,
+                                                     self.width, self.height, i)
+                    if fits:
+                        score = self._score(item, y, seg_w[i], waste,
+                                            rotation=True)
+                        if upper_bound is None or score < upper_bound:
+                            segs.append((score, i, y, True))
         try:
-            _score, seg, y, rot = min(segs, key=lambda x: x[0])
-            return _score, seg, rot, y
+            _score, seg_i, y, rot = min(segs, key=lambda x: x[0])
+            return _score, seg_i, rot, y
         except ValueError:
             return None, None, None, False
 
@@ -214,44 +363,89 @@ class Skyline:
             res = self.wastemap.insert(item, heuristic='best_area')
             if res:
                 self.items.append(item)
-                self.free_area -= item.width * item.height
+                self.free_area -= item.area
+                self._efficiency_dirty = True
                 return True
 
-        _, best_seg, rotation, best_y = self._find_best_score(item)
-        if best_seg:
+        _, best_i, rotation, best_y = self._find_best_score(item)
+        if best_i is not None:
             if rotation:
                 item.rotate()
-            item.x, item.y = (best_seg.x, best_y)
+            item.x, item.y = (self.skyline[best_i].x, best_y)
             self.items.append(item)
-            self.free_area -= item.width * item.height
-            self.skyline = self._update_segment(best_seg, best_y, item)
-            self._merge_segments()
+            self.free_area -= item.area
+            self._efficiency_dirty = True
+            self.skyline = self._update_segment(best_i, best_y, item)
             return True
         return False
 
 
+    def insert_run(self, prev: Item, items: List[Item]) -> int:
+        """
+        Fast path for a run of items identical in size to the
+        just-placed prev. Keep placing items immediately to its
+        right while a segment at the same height has room,
+        skipping the scoring pass. Returns the number placed.
+        """
+        placed = 0
+        for item in items:
+            next_x = prev.x + prev.width
+            seg_i = None
+            for i, seg in enumerate(self.skyline):
+                if seg.x >= next_x:
+                    if seg.x == next_x:
+                        seg_i = i
+                    break
+            if seg_i is None:
+                break
+            seg = self.skyline[seg_i]
+            if seg.y != prev.y or seg.width < prev.width:
+                break
+            if (item.width, item.height) != (prev.width, prev.height):
+                item.rotate()
+            item.x, item.y = (next_x, prev.y)
+            self.items.append(item)
+            self.free_area -= item.area
+            self._efficiency_dirty = True
+            self.skyline = self._update_segment(seg_i, prev.y, item)
+            placed += 1
+            prev = item
+        return placed
+
+
+    @property
+    def efficiency(self) -> float:
+        """
+        Percentage of the bin area filled. Only recomputed
+        after the bin has changed.
+        """
+        if self._efficiency_dirty:
+            self._efficiency = (self.area - self.free_area) / self.area
+            self._efficiency_dirty = False
+        return self._efficiency
+
+
     def bin_stats(self) -> dict:
         """
         Returns a dictionary with compiled stats on the bin tree
         """
 
         stats = {
-            'width': self.x,
-            'height': self.y,
+            'width': self.width,
+            'height': self.height,
             'area': self.area,
-            'efficiency': (self.area - self.free_area) / self.area,
+            'efficiency': self.efficiency,
             'items': self.items,
             }
 
         return stats
 
 
-def scoreBL(segs: List[SkylineSegment], item: Item, y: int, i: int, rotation=False) -> Tuple[int, int]:
+def scoreBL(item: Item, y: int, seg_width: int, waste: int, rotation=False) -> Tuple[int, int]:
     """ Bottom Left """
-    seg = segs[i]
     if rotation:
-        return item.width + y, seg.width
-    return item.height + y, seg.width 
+        return item.width + y, seg_width
+    return item.height + y, seg_width
 
 
 def calc_waste(segs: List[SkylineSegment],
@@ -263,28 +457,13 @@ def calc_waste(segs: List[SkylineSegment],
     Returns the total wasted area if item is
     inserted above segment
     """
-    wasted_area = 0
-    item_left = segs[i].x
-    if not rotation:
-        item_right = item_left + item.width
-    else:
-        item_right = item_left + item.height
-    for seg in segs[i:]:
-        if seg.x >= item_right or seg.x + seg.width <= item_left:
-            break
-        left_side = seg.x
-        right_side = min(item_right, seg.x + seg.width)
-        wasted_area += (right_side - left_side) * (y - seg.y)
-    return wasted_area
+    seg_x, seg_y, seg_w = _flatten_skyline(segs)
+    item_w = item.height if rotation else item.width
+    return _calc_waste_flat(seg_x, seg_y, seg_w, len(seg_x), item_w, y, i)
 
 
-def scoreBF(segs: List[SkylineSegment],
-            item: Item, 
-            y: int,
-            i: int,
-            rotation=False) -> Tuple[int, int]:
+def scoreBF(item: Item, y: int, seg_width: int, waste: int, rotation=False) -> Tuple[int, int]:
     """ Best Fit """
-
     if rotation:
-        return (calc_waste(segs, item, y, i, rotation=True), item.width + y)
-    return (calc_waste(segs, item, y, i, rotation=False), item.height + y)
+        return (waste, item.width + y)
+    return (waste, item.height + y)
@@ -9,9 +9,9 @@ setup(
     author_email='ssbothwell@gmail.com',
     license='Apache2',
     url='https://github.com/ssbothwell/BinPack',
-    install_requires=['sortedcontainers'],
+    install_requires=[],
     download_url='https://github.com/ssbothwell/greedypacker/archive/v0.4.1.tar.gz',
     keywords=['binpacking', 'algorithm', 'greedy', 'library'],
     classifiers=[],
-    python_requires='>=3',
+    python_requires='>=3.10',
 )
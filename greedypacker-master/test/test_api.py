@@ -256,6 +256,73 @@ class BestBinFit(BaseTestCase):
             self.assertEqual(ITEM3.y, 3)
 
 
+    def testSkylineBoundedQueryMatchesUnbounded(self):
+        """
+        Bounded skyline score queries pick the same winning bin
+        as full scoring across several part-filled bins
+        """
+        M = greedypacker.BinManager(8, 4,
+                               pack_algo='skyline',
+                               bin_algo='bin_best_fit',
+                               heuristic='bottom_left',
+                               sorting=False)
+        M._bin_best_fit(greedypacker.Item(8, 3))
+        M._bin_best_fit(greedypacker.Item(8, 2))
+        M._bin_best_fit(greedypacker.Item(4, 2))
+
+        probe = greedypacker.Item(3, 1)
+        unbounded = [binn._find_best_score(probe)[0] for binn in M.bins]
+
+        # The bounded scan _bin_best_fit performs
+        bounded = []
+        best = None
+        for binn in M.bins:
+            if best is None:
+                s = binn._find_best_score(probe)[0]
+            else:
+                s = binn._find_best_score(probe, upper_bound=best)[0]
+            bounded.append(s)
+            if s is not None and (best is None or s < best):
+                best = s
+
+        def winner(scores):
+            return min((i for i, s in enumerate(scores) if s is not None),
+                       key=lambda i: scores[i])
+
+        self.assertEqual(winner(bounded), winner(unbounded))
+
+
+    def testSkylineScoreCacheNeutral(self):
+        """
+        A warm score cache yields the same placement as a cold one
+        """
+        def build():
+            M = greedypacker.BinManager(8, 4,
+                                   pack_algo='skyline',
+                                   bin_algo='bin_best_fit',
+                                   heuristic='bottom_left',
+                                   sorting=False)
+            M._bin_best_fit(greedypacker.Item(8, 3))
+            M._bin_best_fit(greedypacker.Item(8, 2))
+            M._bin_best_fit(greedypacker.Item(2, 1))
+            return M
+
+        warm = build()
+        cold = build()
+        cold._score_cache.clear()
+
+        ITEM = greedypacker.Item(2, 1)
+        ITEM2 = greedypacker.Item(2, 1)
+        warm_bin = warm._bin_best_fit(ITEM)
+        cold_bin = cold._bin_best_fit(ITEM2)
+
+        with self.subTest():
+            self.assertEqual(warm.bins.index(warm_bin),
+                             cold.bins.index(cold_bin))
+        with self.subTest():
+            self.assertEqual((ITEM.x, ITEM.y), (ITEM2.x, ITEM2.y))
+
+
 class BinFirstFit(BaseTestCase):
     def testGuillotineBWFSortingRotation(self):
         """
@@ -1,7 +1,6 @@
 import sys
 import unittest
 
-from sortedcontainers import SortedListWithKey
 from greedypacker import guillotine
 from greedypacker import item
 from .base import BaseTestCase
@@ -41,7 +40,7 @@ class BestShortSide(BaseTestCase):
         F1 = self.freeRectangle(2, 2, 1, 0)
         ITEM = item.Item(1, 1)
 
-        self.BIN.freerects = SortedListWithKey([F0, F1], key=lambda x: x.area)
+        self.BIN.freerects = sorted([F0, F1], key=lambda x: x.area)
         self.BIN.insert(ITEM)
 
         with self.subTest():
@@ -66,7 +65,7 @@ class BestShortSide(BaseTestCase):
         ITEM = item.Item(1, 2)
         
         self.BIN.rotation = True
-        self.BIN.freerects = SortedListWithKey([F0], key=lambda x: x.area)
+        self.BIN.freerects = sorted([F0], key=lambda x: x.area)
         self.BIN.insert(ITEM)
 
         with self.subTest():
@@ -113,7 +112,7 @@ class BestLongSide(BaseTestCase):
         F1 = self.freeRectangle(2, 1, 1, 0)
         ITEM = item.Item(1, 1)
 
-        self.BIN.freerects = SortedListWithKey([F0, F1], key=lambda x: x.area)
+        self.BIN.freerects = sorted([F0, F1], key=lambda x: x.area)
         self.BIN.insert(ITEM)
 
         with self.subTest():
@@ -187,7 +186,7 @@ class BestAreaFit(BaseTestCase):
         F1 = self.freeRectangle(3, 3, 2, 0)
         ITEM = item.Item(1, 1)
 
-        self.BIN.freerects = SortedListWithKey([F0, F1], key=lambda x: x.area)
+        self.BIN.freerects = sorted([F0, F1], key=lambda x: x.area)
         self.BIN.insert(ITEM)
         with self.subTest():
             correct = [self.freeRectangle(2, 1, 0, 1),
@@ -261,7 +260,7 @@ class WorstLongSide(BaseTestCase):
         F1 = self.freeRectangle(2, 1, 1, 0)
         ITEM = item.Item(1, 1)
 
-        self.BIN.freerects = SortedListWithKey([F0, F1], key=lambda x: x.area)
+        self.BIN.freerects = sorted([F0, F1], key=lambda x: x.area)
         self.BIN.insert(ITEM)
 
         with self.subTest():
@@ -335,7 +334,7 @@ class WorstShortSide(BaseTestCase):
         F1 = self.freeRectangle(2, 2, 1, 0)
         ITEM = item.Item(1, 1)
 
-        self.BIN.freerects = SortedListWithKey([F0, F1], key=lambda x: x.area)
+        self.BIN.freerects = sorted([F0, F1], key=lambda x: x.area)
         self.BIN.insert(ITEM)
 
         with self.subTest():
@@ -410,7 +409,7 @@ class WorstAreaFit(BaseTestCase):
         F1 = self.freeRectangle(3, 3, 2, 0)
         ITEM = item.Item(1, 1)
 
-        self.BIN.freerects = SortedListWithKey([F0, F1], key=lambda x: x.area)
+        self.BIN.freerects = sorted([F0, F1], key=lambda x: x.area)
         self.BIN.insert(ITEM)
         with self.subTest():
             correct = [self.freeRectangle(2, 2, 0, 0),
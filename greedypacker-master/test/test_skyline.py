@@ -70,7 +70,7 @@ class Methods(BaseTestCase):
         S1 = skyline.SkylineSegment(0, 2, 2)
         S2 = skyline.SkylineSegment(2, 0, 6)
 
-        res = self.S._update_segment(self.S.skyline[0], 0, I)
+        res = self.S._update_segment(0, 0, I)
         self.assertCountEqual(res, [S1, S2])
 
     
@@ -82,7 +82,7 @@ class Methods(BaseTestCase):
         S2 = skyline.SkylineSegment(2, 0, 6)
         S3 = skyline.SkylineSegment(0, 0, 8)
         self.S.skyline.pop()
-        self.S.skyline.update([S1, S2])
+        self.S.skyline.extend([S1, S2])
         self.S._merge_segments()
         self.assertEqual(self.S.skyline, [S3])
 
@@ -96,7 +96,7 @@ class Methods(BaseTestCase):
         S3 = skyline.SkylineSegment(6, 0, 2)
         S4 = skyline.SkylineSegment(0, 0, 8)
         self.S.skyline.pop()
-        self.S.skyline.update([S1, S2, S3])
+        self.S.skyline.extend([S1, S2, S3])
         self.S._merge_segments()
         self.assertEqual(self.S.skyline, [S4])
         
@@ -109,7 +109,7 @@ class Methods(BaseTestCase):
         S1 = skyline.SkylineSegment(0, 1, 2)
         S2 = skyline.SkylineSegment(2, 0, 6)
         self.S.skyline.pop()
-        self.S.skyline.update([S1, S2])
+        self.S.skyline.extend([S1, S2])
         self.assertEqual(self.S._check_fit(I.width, I.height, 0), (True, 1))
 
 
@@ -121,7 +121,7 @@ class Methods(BaseTestCase):
         S1 = skyline.SkylineSegment(0, 0, 1)
         S2 = skyline.SkylineSegment(1, 3, 7)
         self.S.skyline.pop()
-        self.S.skyline.update([S1, S2])
+        self.S.skyline.extend([S1, S2])
         self.assertEqual(self.S._check_fit(I.width, I.height, 1), (False, None))
 
     
@@ -290,6 +290,104 @@ class WasteMap(BaseTestCase):
         self.assertEqual(I5.y, 1)
 
 
+class InsertRun(BaseTestCase):
+    def setUp(self):
+        self.S = skyline.Skyline(8, 4, heuristic='bottom_left')
+
+
+    def tearDown(self):
+        del self.S
+
+
+    def testRunPlacedRightward(self):
+        """
+        Both run items continue to the right of the seed
+        """
+        I0 = item.Item(2, 2)
+        self.S.insert(I0)
+        I1 = item.Item(2, 2)
+        I2 = item.Item(2, 2)
+        placed = self.S.insert_run(I0, [I1, I2])
+
+        self.assertEqual(placed, 2)
+        self.assertEqual((I1.x, I1.y), (2, 0))
+        self.assertEqual((I2.x, I2.y), (4, 0))
+        self.assertEqual(self.S.items, [I0, I1, I2])
+
+
+    def testRunStopsWhenSegmentTooNarrow(self):
+        """
+        Only 2 of the 8 bin width remain for the second run item
+        """
+        I0 = item.Item(3, 2)
+        self.S.insert(I0)
+        I1 = item.Item(3, 2)
+        I2 = item.Item(3, 2)
+        placed = self.S.insert_run(I0, [I1, I2])
+
+        self.assertEqual(placed, 1)
+        self.assertEqual((I1.x, I1.y), (3, 0))
+        self.assertEqual(self.S.items, [I0, I1])
+
+
+    def testRunStopsAtHeightMismatch(self):
+        """
+        Neighbouring segment sits higher than the seed
+        """
+        I0 = item.Item(2, 1, CornerPoint=(0, 0))
+        self.S.skyline = [skyline.SkylineSegment(0, 1, 2),
+                          skyline.SkylineSegment(2, 2, 6)]
+        placed = self.S.insert_run(I0, [item.Item(2, 1)])
+
+        self.assertEqual(placed, 0)
+        self.assertEqual(self.S.items, [])
+
+
+    def testRunRotatesToMatchSeed(self):
+        """
+        Seed only fits rotated; run items follow its orientation
+        """
+        S = skyline.Skyline(8, 2, heuristic='bottom_left')
+        I0 = item.Item(1, 3)
+        S.insert(I0)
+        self.assertTrue(I0.rotated)
+
+        I1 = item.Item(1, 3)
+        placed = S.insert_run(I0, [I1])
+
+        self.assertEqual(placed, 1)
+        self.assertTrue(I1.rotated)
+        self.assertEqual((I1.width, I1.height), (3, 1))
+        self.assertEqual((I1.x, I1.y), (3, 0))
+
+
+class BinStats(BaseTestCase):
+    def setUp(self):
+        self.S = skyline.Skyline(8, 4, heuristic='bottom_left')
+
+
+    def tearDown(self):
+        del self.S
+
+
+    def testReturn(self):
+        ITEM = item.Item(4, 2)
+        ITEM2 = item.Item(2, 2)
+        self.S.insert(ITEM)
+        self.S.insert(ITEM2)
+        correct = {
+            'width': 8,
+            'height': 4,
+            'area': 32,
+            'efficiency': 0.375,
+            'items': [ITEM, ITEM2],
+            }
+
+        self.assertEqual(self.S.bin_stats(), correct)
+        # Second call serves the cached efficiency
+        self.assertEqual(self.S.bin_stats(), correct)
+
+
 def load_tests(loader, tests, pattern):
     suite = unittest.TestSuite()
     if pattern is None:
@@ -297,6 +395,8 @@ def load_tests(loader, tests, pattern):
         suite.addTests(loader.loadTestsFromTestCase(BottomLeft))
         suite.addTests(loader.loadTestsFromTestCase(BestFit))
         suite.addTests(loader.loadTestsFromTestCase(WasteMap))
+        suite.addTests(loader.loadTestsFromTestCase(InsertRun))
+        suite.addTests(loader.loadTestsFromTestCase(BinStats))
     else:
         tests = loader.loadTestsFromName(pattern,
                                          module=sys.modules[__name__])